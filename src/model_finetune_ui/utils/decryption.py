@@ -7,18 +7,174 @@
 维度从解密后的数据自动反推
 """
 
+import binascii
+import functools
+import hashlib
 import io
 import json
 import logging
+import mmap
+import os
+import stat
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+import numpy as np
 import pandas as pd
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
+from .encryption import _derive_key
 from .utils import ConfigManager, EnhancedLogger, performance_monitor
 
+try:
+    import orjson
+except ImportError:  # orjson为可选加速依赖，不可用时使用标准库json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# 十六进制字符集（用于BIN格式检测）
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+# hex_reverse格式分块解码的块大小（偶数，保证每块都是完整的字节对）
+_HEX_CHUNK_SIZE = 1 << 20
+
+# bytes.fromhex会忽略的ASCII空白字符
+_ASCII_WHITESPACE = b" \t\n\r\v\f"
+
+# 参与维度推断的系数键
+_DIMENSION_KEYS = ("A", "w", "a", "b", "Range")
+
+# JSON解码只会产生这几种精确数值类型（bool是int子类，与isinstance判断保持一致）
+_NUMERIC_TYPES = frozenset((int, float, bool))
+
+# 各模型类型的必需字段（按错误提示顺序），及用于快速子集判断的集合
+_REQUIRED_FIELDS: dict[int, tuple[str, ...]] = {
+    0: ("A", "Range"),
+    1: ("w", "a", "b", "A", "Range"),
+}
+_REQUIRED_FIELD_SETS = {
+    model_type: frozenset(fields) for model_type, fields in _REQUIRED_FIELDS.items()
+}
+
+# 固定的DataFrame列索引模板（name等属性可变，交给DataFrame前须先copy）
+_A_COLUMNS = pd.Index(["A"])
+_RANGE_COLUMNS = pd.Index(["min", "max"])
+
+# CSV标签中出现时需要加引号的字符
+_CSV_QUOTE_CHARS = (",", '"', "\r", "\n")
+
+
+def _loads_json(data: bytes | bytearray | str) -> Any:
+    """解析JSON，优先使用orjson（直接接受bytes，无需先解码为str）
+
+    orjson不支持标准库json.dumps可能写出的NaN/Infinity字面量，
+    此时回退到标准库json解析。
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=16)
+def _generic_names(prefix: str, count: int) -> tuple[str, ...]:
+    """生成 prefix1..prefixN 名称（按数量缓存，重复维度不再逐个构造字符串）"""
+    return tuple(f"{prefix}{i}" for i in range(1, count + 1))
+
+
+@functools.lru_cache(maxsize=16)
+def _label_index(labels: tuple[str, ...]) -> pd.Index:
+    """按标签序列缓存pd.Index模板，避免每次都从标签重新推断类型
+
+    缓存对象在进程内共享，而Index的name等属性可变，交给DataFrame前须先copy。
+    """
+    return pd.Index(labels)
+
+
+@functools.lru_cache(maxsize=32)
+def _expected_sizes(
+    param_count: int, feature_count: int
+) -> tuple[tuple[str, int], ...]:
+    """Type 1各字段的期望长度（按形状缓存，重复加载同形状模型时直接复用）"""
+    return (
+        ("w", feature_count * param_count),  # 特征x参数
+        ("a", feature_count * param_count),  # 特征x参数
+        ("b", param_count * feature_count),  # 参数x特征
+        ("A", param_count),
+        ("Range", param_count * 2),
+    )
+
+
+def _missing_fields(data: dict[str, Any], model_type: int) -> list[str]:
+    """按声明顺序返回缺失的必需字段；字段齐全时只做一次集合包含判断"""
+    if _REQUIRED_FIELD_SETS[model_type] <= data.keys():
+        return []
+    return [f for f in _REQUIRED_FIELDS[model_type] if f not in data]
+
+
+def _first_non_numeric(values: list) -> int | None:
+    """返回首个非数字元素的下标，全为数字时返回None
+
+    先用一次numpy转换批量判断（纯数字列表会得到布尔/整数/浮点dtype），
+    只有转换结果不是一维数值数组时才逐个元素定位出错位置。
+    """
+    try:
+        arr = np.asarray(values)
+    except (TypeError, ValueError):
+        arr = None
+    if arr is not None and arr.ndim == 1 and arr.dtype.kind in "biuf":
+        return None
+    return next(
+        (i for i, val in enumerate(values) if type(val) not in _NUMERIC_TYPES),
+        None,
+    )
+
+
+def _copy_payload(data: dict[str, Any]) -> dict[str, Any]:
+    """复制解密数据，各系数列表单独复制，避免调用方修改影响缓存"""
+    return {
+        key: list(value) if type(value) is list else value
+        for key, value in data.items()
+    }
+
+
+def _is_plain_float_label(label: Any) -> bool:
+    """标签写入CSV时无需加引号（不含分隔符、引号、换行，且非空）"""
+    return (
+        type(label) is str
+        and label != ""
+        and not any(ch in label for ch in _CSV_QUOTE_CHARS)
+    )
+
+
+def _is_plain_float_frame(df: pd.DataFrame) -> bool:
+    """是否为可走快速CSV编码的系数表：float64数值 + 无名、无需转义的字符串标签"""
+    return (
+        len(df.dtypes) > 0
+        and all(dtype == np.float64 for dtype in df.dtypes)
+        and df.index.name is None
+        and not isinstance(df.index, pd.MultiIndex)
+        and not isinstance(df.columns, pd.MultiIndex)
+        and all(_is_plain_float_label(label) for label in df.index)
+        and all(_is_plain_float_label(label) for label in df.columns)
+    )
+
+
+def _render_float_csv(df: pd.DataFrame) -> bytes:
+    """不经pandas格式化直接拼接CSV，输出与 df.to_csv(index=True) 逐字节一致
+
+    float的repr即pandas使用的最短往返表示，NaN按pandas默认写为空字符串。
+    """
+    lines = [",".join(["", *df.columns])]
+    for label, row in zip(df.index, df.to_numpy().tolist(), strict=True):
+        lines.append(",".join([label, *("" if v != v else repr(v) for v in row)]))
+    lines.append("")
+    return os.linesep.join(lines).encode("utf-8")
+
 
 class DecryptionManager:
     """解密管理器，用于解密bin文件并解析参数。
@@ -27,25 +183,33 @@ class DecryptionManager:
     并提供CSV格式导出功能。
     """
 
+    # 标准水质参数（固定）
+    _DEFAULT_WATER_PARAMS = (
+        "turbidity",
+        "ss",
+        "sd",
+        "do",
+        "codmn",
+        "codcr",
+        "chla",
+        "tn",
+        "tp",
+        "chroma",
+        "nh3n",
+    )
+    # 特征站点默认26个（向后兼容），解密时会根据数据动态调整
+    _DEFAULT_FEATURE_STATIONS = tuple(f"STZ{i}" for i in range(1, 27))
+
     def __init__(self):
-        # 标准水质参数（固定）
-        self._default_water_params = [
-            "turbidity",
-            "ss",
-            "sd",
-            "do",
-            "codmn",
-            "codcr",
-            "chla",
-            "tn",
-            "tp",
-            "chroma",
-            "nh3n",
-        ]
-        # 特征站点默认26个（向后兼容），解密时会根据数据动态调整
-        self._default_feature_stations = [f"STZ{i}" for i in range(1, 27)]
+        # 实例持有可替换的列表副本，类级元组只构造一次
+        self._default_water_params = list(self._DEFAULT_WATER_PARAMS)
+        self._default_feature_stations = list(self._DEFAULT_FEATURE_STATIONS)
         # 从文件中检测到的配置
         self._detected_config: dict[str, Any] | None = None
+        # 成功读取的解密配置（读取失败时不缓存）
+        self._decryption_config: dict[str, Any] | None = None
+        # 最近一次解密的 (文件内容指纹, 原始数据副本)
+        self._decrypt_cache: tuple[bytes, dict[str, Any]] | None = None
 
     @property
     def water_params(self) -> list[str]:
@@ -67,16 +231,26 @@ class DecryptionManager:
         self._default_feature_stations = value
 
     def get_decryption_config(self) -> dict[str, Any]:
-        """获取解密配置"""
-        try:
-            return ConfigManager.get_encryption_config()
-        except Exception as e:
-            logger.error(f"无法获取解密配置: {e}")
-            return {
-                "password": "default_password",
-                "salt": "default_salt",
-                "iv": "default_iv",
-            }
+        """获取解密配置（只缓存成功读取的结果，失败时返回默认值，配置补齐后可恢复）"""
+        if self._decryption_config is None:
+            try:
+                self._decryption_config = ConfigManager.get_encryption_config()
+            except Exception as e:
+                logger.error("无法获取解密配置: %s", e)
+                return {
+                    "password": "default_password",
+                    "salt": "default_salt",
+                    "iv": "default_iv",
+                }
+        return self._decryption_config
+
+    def invalidate_config(self) -> None:
+        """清除已缓存的解密配置，下次使用时重新读取（配置变更或测试时使用）
+
+        按旧配置解密得到的缓存结果一并清除。
+        """
+        self._decryption_config = None
+        self._decrypt_cache = None
 
     @performance_monitor("decrypt_bin_file")
     def decrypt_bin_file(self, bin_file_path: str) -> dict[str, Any] | None:
@@ -98,71 +272,35 @@ class DecryptionManager:
             logger.info("🔍 步骤1/5: 验证文件路径和属性...")
             validation_result = self._validate_file_path(bin_file_path)
             if not validation_result["valid"]:
-                logger.error(f"❌ 文件路径验证失败: {validation_result['error']}")
+                logger.error("❌ 文件路径验证失败: %s", validation_result["error"])
                 return None
 
             file_size = validation_result.get("size", 0)
-            logger.info(f"✅ 文件验证通过: {bin_file_path} ({file_size:,} bytes)")
-
-            # 步骤2：读取文件
-            logger.info("🔍 步骤2/4: 读取文件...")
-            with open(bin_file_path, "rb") as f:
-                file_data = f.read()
-            logger.info(f"📦 文件数据长度: {len(file_data)} bytes")
-
-            # 检测文件格式
-            bin_format = self._detect_bin_format(file_data)
-            logger.info(f"📋 检测到文件格式: {bin_format}")
-
-            if bin_format == "hex_reverse":
-                # 预警器专用格式
-                logger.info("🔓 使用预警器专用方式解密...")
-                decrypted_data = self._decrypt_hex_reverse(file_data)
-            else:
-                # AES加密格式（现有逻辑）
-                # 步骤3：获取解密配置
-                logger.info("🔧 步骤3/4: 获取解密配置...")
-                decryption_config = self.get_decryption_config()
-                logger.info("✅ 解密配置已加载")
-
-                # 步骤4：执行解密
-                logger.info("🔓 步骤4/4: 执行BIN文件解密...")
-                decrypted_data = self._decrypt_with_local_module(
-                    file_data, decryption_config
-                )
-
-                if not decrypted_data:
-                    # 尝试外部解密函数
-                    try:
-                        from autowaterqualitymodeler.utils.encryption import (
-                            decrypt_file,
-                        )
+            logger.info(
+                "✅ 文件验证通过: %s (%s bytes)", bin_file_path, format(file_size, ",")
+            )
 
-                        logger.info("尝试使用外部解密函数...")
-                        decrypted_result = decrypt_file(bin_file_path)
-                        if decrypted_result:
-                            if isinstance(decrypted_result, dict):
-                                decrypted_data = decrypted_result
-                            elif isinstance(decrypted_result, str):
-                                decrypted_data = json.loads(decrypted_result)
-                            logger.info("✅ 外部解密成功")
-                    except ImportError:
-                        logger.warning("⚠️ 外部解密函数不可用")
+            decrypted_data = self._read_and_decrypt(bin_file_path)
 
             if decrypted_data:
+                # 只推断一次维度，供配置设置和数据验证共用
+                dimensions = self._infer_dimensions(decrypted_data)
+                param_count = dimensions[0]
+
                 # 从数据反推维度并设置配置
-                self._infer_dimensions_from_data(decrypted_data)
+                self._infer_dimensions_from_data(decrypted_data, dimensions)
 
                 # 验证解密数据
-                validation_result = self._validate_decrypted_data(decrypted_data)
+                validation_result = self._validate_decrypted_data(
+                    decrypted_data, dimensions
+                )
                 if not validation_result["valid"]:
-                    logger.error(f"❌ 解密数据验证失败: {validation_result['error']}")
+                    logger.error("❌ 解密数据验证失败: %s", validation_result["error"])
                     return None
 
                 model_type = decrypted_data.get("type", "未知")
-                feature_count = (
-                    len(self.feature_stations) if self.feature_stations else None
-                )
+                features = self.feature_stations
+                feature_count = len(features) if features else None
                 logger.info("🎉 BIN文件解密完成！")
                 feature_label = (
                     f"{feature_count}特征"
@@ -170,7 +308,10 @@ class DecryptionManager:
                     else "特征数不适用"
                 )
                 logger.info(
-                    f"📊 模型信息: Type {model_type} ({feature_label}×{len(self.water_params)}参数)"
+                    "📊 模型信息: Type %s (%s×%s参数)",
+                    model_type,
+                    feature_label,
+                    param_count,
                 )
 
                 return decrypted_data
@@ -179,11 +320,74 @@ class DecryptionManager:
                 return None
 
         except Exception as e:
-            logger.error(f"❌ 解密过程中发生错误: {str(e)}")
+            logger.error("❌ 解密过程中发生错误: %s", e)
             return None
 
+    def _read_and_decrypt(self, bin_file_path: str) -> dict[str, Any] | None:
+        """读取bin文件并按检测到的格式解密，失败返回None"""
+        # 步骤2：读取文件（内存映射，按需分页读入，避免整文件复制为bytes）
+        logger.info("🔍 步骤2/4: 读取文件...")
+        with (
+            open(bin_file_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as file_data,
+        ):
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                file_data.madvise(mmap.MADV_SEQUENTIAL)
+            logger.info("📦 文件数据长度: %s bytes", len(file_data))
+
+            # 按文件内容指纹复用上次的解密结果：上传文件会复用同一临时路径，
+            # 修改时间精度有限，不能只凭路径/大小/mtime判断文件是否变化
+            fingerprint = hashlib.blake2b(file_data, digest_size=16).digest()
+            cached = self._decrypt_cache
+            if cached is not None and cached[0] == fingerprint:
+                logger.info("♻️ 文件内容未变化，复用上次解密结果")
+                return _copy_payload(cached[1])
+
+            # 检测文件格式
+            bin_format = self._detect_bin_format(file_data)
+            logger.info("📋 检测到文件格式: %s", bin_format)
+
+            if bin_format == "hex_reverse":
+                # 预警器专用格式
+                logger.info("🔓 使用预警器专用方式解密...")
+                decrypted_data = self._decrypt_hex_reverse(file_data)
+            else:
+                # AES加密格式（现有逻辑）
+                # 步骤3：获取解密配置
+                logger.info("🔧 步骤3/4: 获取解密配置...")
+                decryption_config = self.get_decryption_config()
+                logger.info("✅ 解密配置已加载")
+
+                # 步骤4：执行解密
+                logger.info("🔓 步骤4/4: 执行BIN文件解密...")
+                decrypted_data = self._decrypt_with_local_module(
+                    file_data, decryption_config
+                )
+
+        if bin_format != "hex_reverse" and not decrypted_data:
+            # AES本地解密失败时尝试外部解密函数
+            try:
+                from autowaterqualitymodeler.utils.encryption import (
+                    decrypt_file,
+                )
+
+                logger.info("尝试使用外部解密函数...")
+                decrypted_result = decrypt_file(bin_file_path)
+                if decrypted_result:
+                    if isinstance(decrypted_result, dict):
+                        decrypted_data = decrypted_result
+                    elif isinstance(decrypted_result, str):
+                        decrypted_data = _loads_json(decrypted_result)
+                    logger.info("✅ 外部解密成功")
+            except ImportError:
+                logger.warning("⚠️ 外部解密函数不可用")
+
+        if decrypted_data:
+            self._decrypt_cache = (fingerprint, _copy_payload(decrypted_data))
+        return decrypted_data
+
     def _decrypt_with_local_module(
-        self, encrypted_data: bytes, config: dict[str, Any]
+        self, encrypted_data: bytes | mmap.mmap, config: dict[str, Any]
     ) -> dict[str, Any] | None:
         """使用本地加密模块解密数据
 
@@ -195,10 +399,6 @@ class DecryptionManager:
             解密后的数据字典，失败返回None
         """
         try:
-            from cryptography.hazmat.primitives import hashes, padding
-            from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-            from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-
             # 获取配置参数
             password = config.get("password", "water_quality_analysis_key")
             salt = config.get("salt", "water_quality_salt")
@@ -215,39 +415,45 @@ class DecryptionManager:
                 return None
 
             iv = encrypted_data[:16]
-            ciphertext = encrypted_data[16:]
-
-            logger.info(f"📦 IV长度: {len(iv)}, 密文长度: {len(ciphertext)}")
 
-            # 生成密钥
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
+            logger.info(
+                "📦 IV长度: %s, 密文长度: %s", len(iv), len(encrypted_data) - 16
             )
-            key = kdf.derive(password)
 
-            # 解密
+            # 生成密钥（与加密端共用同一个按参数缓存的PBKDF2派生）
+            key = _derive_key(password, salt, 100000, 32)
+
+            # 解密（cryptography经OpenSSL EVP调度，CPU支持时自动使用AES-NI）
             cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
             decryptor = cipher.decryptor()
-            decrypted_padded = decryptor.update(ciphertext) + decryptor.finalize()
-
-            # 移除PKCS7填充
-            unpadder = padding.PKCS7(128).unpadder()
-            decrypted_data = unpadder.update(decrypted_padded) + unpadder.finalize()
+            # 密文通过memoryview切片直接交给解密器，不复制为bytes；
+            # with块结束即释放视图，之后mmap才能正常关闭
+            with (
+                memoryview(encrypted_data) as view,
+                view[16:] as ciphertext,
+            ):
+                decrypted_padded = decryptor.update(ciphertext) + decryptor.finalize()
+
+            # 移除PKCS7填充（末字节即填充长度，且填充字节须全部等于该值）
+            pad_len = decrypted_padded[-1] if decrypted_padded else 0
+            if (
+                not 1 <= pad_len <= 16
+                or decrypted_padded[-pad_len:] != bytes([pad_len]) * pad_len
+            ):
+                raise ValueError("PKCS7填充无效")
+            decrypted_data = decrypted_padded[:-pad_len]
 
             # 解析JSON
-            result = json.loads(decrypted_data.decode("utf-8"))
+            result = _loads_json(decrypted_data)
             logger.info("✅ 本地解密成功")
             return result
 
         except Exception as e:
-            logger.error(f"❌ 本地解密失败: {str(e)}")
+            logger.error("❌ 本地解密失败: %s", e)
             return None
 
     @staticmethod
-    def _detect_bin_format(file_data: bytes) -> str:
+    def _detect_bin_format(file_data: bytes | mmap.mmap) -> str:
         """检测BIN文件格式
 
         Args:
@@ -256,15 +462,15 @@ class DecryptionManager:
         Returns:
             "hex_reverse" 或 "aes"
         """
-        try:
-            sample = file_data[:64].decode("utf-8")
-            if all(c in "0123456789abcdefABCDEF" for c in sample):
-                return "hex_reverse"
-        except (UnicodeDecodeError, ValueError):
-            pass
+        # 删除所有十六进制字符后若无剩余，则样本全为十六进制字符
+        sample = file_data[:64]
+        if not sample.translate(None, _HEX_DIGITS):
+            return "hex_reverse"
         return "aes"
 
-    def _decrypt_hex_reverse(self, file_data: bytes) -> dict[str, Any] | None:
+    def _decrypt_hex_reverse(
+        self, file_data: bytes | mmap.mmap
+    ) -> dict[str, Any] | None:
         """解密十六进制倒序混淆格式的BIN文件
 
         Args:
@@ -274,46 +480,61 @@ class DecryptionManager:
             解密后的数据字典，失败返回None
         """
         try:
-            reversed_hex = file_data.decode("utf-8")
-            hex_string = reversed_hex[::-1]
-            data_json = bytes.fromhex(hex_string).decode("utf-8")
-            result = json.loads(data_json)
+            # 十六进制字符均为ASCII，按字节倒序即等价于按字符倒序。
+            # 从尾部向前分块倒序并解码，峰值内存约为输出大小加一个分块，
+            # 而非整份倒序副本。与bytes.fromhex一致，忽略其中的ASCII空白
+            # （如换行），奇数个字符时把半个字节留给下一块
+            decoded = bytearray()
+            carry = bytearray()
+            for chunk_end in range(len(file_data), 0, -_HEX_CHUNK_SIZE):
+                chunk = bytearray(
+                    file_data[max(0, chunk_end - _HEX_CHUNK_SIZE) : chunk_end]
+                )
+                chunk.reverse()
+                chunk = carry + chunk.translate(None, _ASCII_WHITESPACE)
+                split = len(chunk) & ~1
+                carry = chunk[split:]
+                decoded += binascii.unhexlify(chunk[:split])
+            if carry:
+                raise ValueError("十六进制数据长度为奇数")
+            result = _loads_json(decoded)
             logger.info("✅ 预警器专用格式解密成功")
             return result
         except Exception as e:
-            logger.error(f"❌ 预警器专用解密失败: {str(e)}")
+            logger.error("❌ 预警器专用解密失败: %s", e)
             return None
 
     def _simple_decrypt(self, file_path: str) -> dict[str, Any] | None:
         """简化解密方法（当外部解密函数不可用时）"""
         try:
             # 尝试直接读取JSON（用于测试）
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _loads_json(Path(file_path).read_bytes())
             logger.info("使用简化解密成功")
             return data
-        except Exception:
-            logger.error("简化解密也失败")
+        except (OSError, ValueError) as e:
+            # ValueError涵盖json/orjson的JSONDecodeError及UnicodeDecodeError
+            logger.error("简化解密也失败: %s", e)
             return None
 
     @performance_monitor("parse_to_csv_format")
     def parse_to_csv_format(
-        self, decrypted_data: dict[str, Any]
+        self, decrypted_data: dict[str, Any], fields: set[str] | None = None
     ) -> dict[str, pd.DataFrame]:
         """
         将解密数据解析为CSV格式
 
         Args:
             decrypted_data: 解密后的数据
+            fields: 只解析这些输出（如{"range_data", "A_coefficients"}），
+                None表示全部
 
         Returns:
             包含各系数DataFrame的字典
         """
         try:
             model_type = decrypted_data.get("type", 0)
-            feature_count = (
-                len(self.feature_stations) if self.feature_stations else None
-            )
+            features = self.feature_stations
+            feature_count = len(features) if features else None
 
             logger.info("📋 开始解析数据为CSV格式...")
             feature_label = (
@@ -322,178 +543,166 @@ class DecryptionManager:
                 else "特征站点不适用"
             )
             logger.info(
-                f"📊 模型配置: Type {model_type}, {feature_label}, {len(self.water_params)}个水质参数"
+                "📊 模型配置: Type %s, %s, %s个水质参数",
+                model_type,
+                feature_label,
+                len(self.water_params),
             )
 
-            csv_data = {}
-
-            if model_type == 0:
-                logger.info("🎯 解析Type 0模型数据 (A系数 + Range数据)...")
-                csv_data.update(self._parse_type_0_data(decrypted_data))
-            elif model_type == 1:
-                logger.info("🎯 解析Type 1模型数据 (w, a, b, A系数 + Range数据)...")
-                csv_data.update(self._parse_type_1_data(decrypted_data))
-            else:
-                logger.error(f"❌ 不支持的模型类型: {model_type}")
+            entry = self._MODEL_PARSERS.get(model_type)
+            if entry is None:
+                logger.error("❌ 不支持的模型类型: %s", model_type)
                 return {}
 
-            # 显示解析结果统计
-            total_cells = sum(df.size for df in csv_data.values())
-            total_non_zero = sum(
-                (df != 0).sum().sum()
-                for df in csv_data.values()
-                if df.select_dtypes(include=[float, int]).size > 0
-            )
-
-            logger.info("✅ CSV数据解析完成！")
-            logger.info(f"📄 生成文件数量: {len(csv_data)}个")
-            logger.info(
-                f"📊 数据统计: {total_cells:,}个数据单元, {total_non_zero:,}个非零值"
-            )
-
-            # 显示各文件详情
-            for filename, df in csv_data.items():
-                non_zero_count = (
-                    (df != 0).sum().sum()
-                    if df.select_dtypes(include=[float, int]).size > 0
-                    else df.size
+            parser, description = entry
+            logger.info("🎯 解析Type %s模型数据 (%s)...", model_type, description)
+            csv_data = parser(self, decrypted_data, fields)
+
+            # 显示解析结果统计（INFO被过滤时跳过整段统计扫描）
+            if logger.isEnabledFor(logging.INFO):
+                # 每个DataFrame只扫描一次，结果供汇总和明细复用
+                non_zero_counts: dict[str, int | None] = {}
+                for filename, df in csv_data.items():
+                    values = df.to_numpy()
+                    non_zero_counts[filename] = (
+                        int(np.count_nonzero(values))
+                        if values.dtype.kind in "iuf"
+                        else None
+                    )
+                total_cells = sum(df.size for df in csv_data.values())
+                total_non_zero = sum(
+                    count for count in non_zero_counts.values() if count is not None
                 )
+
+                logger.info("✅ CSV数据解析完成！")
+                logger.info("📄 生成文件数量: %s个", len(csv_data))
                 logger.info(
-                    f"  📈 {filename}: {df.shape[0]}×{df.shape[1]} ({non_zero_count}个非零值)"
+                    "📊 数据统计: %s个数据单元, %s个非零值",
+                    format(total_cells, ","),
+                    format(total_non_zero, ","),
                 )
 
+                # 显示各文件详情
+                for filename, df in csv_data.items():
+                    non_zero_count = non_zero_counts[filename]
+                    if non_zero_count is None:
+                        non_zero_count = df.size
+                    logger.info(
+                        "  📈 %s: %s×%s (%s个非零值)",
+                        filename,
+                        df.shape[0],
+                        df.shape[1],
+                        non_zero_count,
+                    )
+
             return csv_data
 
         except Exception as e:
-            logger.error(f"❌ 解析CSV格式时发生错误: {str(e)}")
+            logger.error("❌ 解析CSV格式时发生错误: %s", e)
             return {}
 
-    def _parse_type_0_data(self, data: dict[str, Any]) -> dict[str, pd.DataFrame]:
-        """解析Type 0数据（A系数 + Range）"""
+    def _coefficient_schema(
+        self,
+    ) -> dict[int, list[tuple[str, str, pd.Index, pd.Index]]]:
+        """按模型类型给出系数解析规则
+
+        每条规则为 (数据键, 输出名, 行索引, 列名)，行列来自当前（可能是反推得到的）
+        维度配置。Range数据有额外的合理性检查，由 _parse_range_data 单独处理。
+        """
+        params = _label_index(tuple(self.water_params))
+        stations = self.feature_stations
+        features = _label_index(tuple(stations)) if stations is not None else None
+        a_spec = ("A", "A_coefficients", params, _A_COLUMNS)
+        return {
+            0: [a_spec],
+            1: [
+                ("w", "w_coefficients", features, params),  # 特征x参数
+                ("a", "a_coefficients", features, params),  # 特征x参数
+                ("b", "b_coefficients", params, features),  # 参数x特征
+                a_spec,
+            ],
+        }
+
+    def _parse_coefficients(
+        self,
+        data: dict[str, Any],
+        specs: list[tuple[str, str, pd.Index, pd.Index]],
+    ) -> dict[str, pd.DataFrame]:
+        """按解析规则将扁平系数数组重塑为DataFrame"""
         csv_data = {}
 
-        try:
-            # 解析A系数
-            if "A" in data:
-                a_values = data["A"]
-                if len(a_values) == len(self.water_params):
-                    # 检查是否有异常值
-                    if any(pd.isna(val) for val in a_values):
-                        logger.warning("A系数中包含NaN值")
-
-                    df_a = pd.DataFrame({"A": a_values}, index=self.water_params)
-                    csv_data["A_coefficients"] = df_a
-                    logger.info(f"解析A系数: {df_a.shape}")
-                else:
-                    logger.error(
-                        f"A系数长度不匹配: 期望{len(self.water_params)}, 实际{len(a_values)}"
-                    )
+        for key, name, index, columns in specs:
+            if key not in data:
+                continue
 
-            # 解析Range数据
-            csv_data.update(self._parse_range_data(data))
+            values = data[key]
+            expected_size = len(index) * len(columns)
+            if len(values) != expected_size:
+                logger.error(
+                    "%s系数长度不匹配: 期望%s, 实际%s", key, expected_size, len(values)
+                )
+                continue
 
-        except Exception as e:
-            logger.error(f"Type 0数据解析失败: {str(e)}")
+            matrix = self._reshape_to_matrix(values, len(index), len(columns))
+            # 直接以reshape后的数组为底层存储（pandas 3默认会复制ndarray）
+            # 索引为共享模板，浅复制后再交给DataFrame，避免修改name互相影响
+            df = pd.DataFrame(
+                matrix, index=index.copy(), columns=columns.copy(), copy=False
+            )
+            # 检查异常值（直接在float64底层数组上归约）
+            if np.isnan(matrix).any():
+                logger.warning("%s系数中包含NaN值", key)
+            csv_data[name] = df
+            logger.info("解析%s系数: %s", key, df.shape)
 
         return csv_data
 
-    def _parse_type_1_data(self, data: dict[str, Any]) -> dict[str, pd.DataFrame]:
-        """解析Type 1数据（w、a、b、A系数 + Range）"""
+    def _parse_model_data(
+        self,
+        data: dict[str, Any],
+        model_type: int,
+        label: str,
+        fields: set[str] | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """按模型类型的系数规则解析，并追加Range数据（结果直接写入同一个字典）"""
         csv_data = {}
 
         try:
-            # 解析w系数 (特征x参数)
-            if "w" in data:
-                w_values = data["w"]
-                expected_size = len(self.feature_stations) * len(self.water_params)
-                if len(w_values) == expected_size:
-                    w_matrix = self._reshape_to_matrix(
-                        w_values, len(self.feature_stations), len(self.water_params)
-                    )
-                    if w_matrix:  # 检查重塑是否成功
-                        df_w = pd.DataFrame(
-                            w_matrix,
-                            index=self.feature_stations,
-                            columns=self.water_params,
-                        )
-                        # 检查异常值
-                        if df_w.isna().any().any():
-                            logger.warning("w系数中包含NaN值")
-                        csv_data["w_coefficients"] = df_w
-                        logger.info(f"解析w系数: {df_w.shape}")
-                else:
-                    logger.error(
-                        f"w系数长度不匹配: 期望{expected_size}, 实际{len(w_values)}"
-                    )
-
-            # 解析a系数 (特征x参数)
-            if "a" in data:
-                a_values = data["a"]
-                expected_size = len(self.feature_stations) * len(self.water_params)
-                if len(a_values) == expected_size:
-                    a_matrix = self._reshape_to_matrix(
-                        a_values, len(self.feature_stations), len(self.water_params)
-                    )
-                    if a_matrix:
-                        df_a = pd.DataFrame(
-                            a_matrix,
-                            index=self.feature_stations,
-                            columns=self.water_params,
-                        )
-                        if df_a.isna().any().any():
-                            logger.warning("a系数中包含NaN值")
-                        csv_data["a_coefficients"] = df_a
-                        logger.info(f"解析a系数: {df_a.shape}")
-                else:
-                    logger.error(
-                        f"a系数长度不匹配: 期望{expected_size}, 实际{len(a_values)}"
-                    )
-
-            # 解析b系数 (参数x特征)
-            if "b" in data:
-                b_values = data["b"]
-                expected_size = len(self.water_params) * len(self.feature_stations)
-                if len(b_values) == expected_size:
-                    b_matrix = self._reshape_to_matrix(
-                        b_values, len(self.water_params), len(self.feature_stations)
-                    )
-                    if b_matrix:
-                        df_b = pd.DataFrame(
-                            b_matrix,
-                            index=self.water_params,
-                            columns=self.feature_stations,
-                        )
-                        if df_b.isna().any().any():
-                            logger.warning("b系数中包含NaN值")
-                        csv_data["b_coefficients"] = df_b
-                        logger.info(f"解析b系数: {df_b.shape}")
-                else:
-                    logger.error(
-                        f"b系数长度不匹配: 期望{expected_size}, 实际{len(b_values)}"
-                    )
+            specs = self._coefficient_schema()[model_type]
+            if fields is not None:
+                # 未请求的输出不做reshape和DataFrame构造
+                specs = [spec for spec in specs if spec[1] in fields]
 
-            # 解析A系数
-            if "A" in data:
-                A_values = data["A"]
-                if len(A_values) == len(self.water_params):
-                    if any(pd.isna(val) for val in A_values):
-                        logger.warning("A系数中包含NaN值")
-                    df_A = pd.DataFrame({"A": A_values}, index=self.water_params)
-                    csv_data["A_coefficients"] = df_A
-                    logger.info(f"解析A系数: {df_A.shape}")
-                else:
-                    logger.error(
-                        f"A系数长度不匹配: 期望{len(self.water_params)}, 实际{len(A_values)}"
-                    )
+            # 系数解析结果本身就是新字典，直接沿用，不再复制到空字典中
+            csv_data = self._parse_coefficients(data, specs)
 
             # 解析Range数据
-            csv_data.update(self._parse_range_data(data))
+            if fields is None or "range_data" in fields:
+                csv_data.update(self._parse_range_data(data))
 
         except Exception as e:
-            logger.error(f"Type 1数据解析失败: {str(e)}")
+            logger.error("%s数据解析失败: %s", label, e)
 
         return csv_data
 
+    def _parse_type_0_data(
+        self, data: dict[str, Any], fields: set[str] | None = None
+    ) -> dict[str, pd.DataFrame]:
+        """解析Type 0数据（A系数 + Range）"""
+        return self._parse_model_data(data, 0, "Type 0", fields)
+
+    def _parse_type_1_data(
+        self, data: dict[str, Any], fields: set[str] | None = None
+    ) -> dict[str, pd.DataFrame]:
+        """解析Type 1数据（w、a、b、A系数 + Range）"""
+        return self._parse_model_data(data, 1, "Type 1", fields)
+
+    # 模型类型 -> (解析方法, 日志描述)，新增类型只需在此登记
+    _MODEL_PARSERS = {
+        0: (_parse_type_0_data, "A系数 + Range数据"),
+        1: (_parse_type_1_data, "w, a, b, A系数 + Range数据"),
+    }
+
     def _parse_range_data(self, data: dict[str, Any]) -> dict[str, pd.DataFrame]:
         """解析Range数据"""
         csv_data = {}
@@ -501,65 +710,87 @@ class DecryptionManager:
         try:
             if "Range" in data:
                 range_values = data["Range"]
-                expected_size = len(self.water_params) * 2
+                params = _label_index(tuple(self.water_params))
+                param_count = len(params)
+                expected_size = param_count * 2
 
                 if len(range_values) == expected_size:
-                    # 重新组织为min/max列
-                    range_matrix = self._reshape_to_matrix(
-                        range_values, len(self.water_params), 2
+                    # 长度已校验，直接重组为(P, 2)的min/max矩阵
+                    range_matrix = np.asarray(range_values, dtype=np.float64).reshape(
+                        param_count, 2
                     )
-                    if range_matrix:
-                        df_range = pd.DataFrame(
-                            range_matrix,
-                            index=self.water_params,
-                            columns=["min", "max"],
+                    df_range = pd.DataFrame(
+                        range_matrix,
+                        index=params.copy(),
+                        columns=_RANGE_COLUMNS.copy(),
+                        copy=False,
+                    )
+
+                    # 检查异常值
+                    if np.isnan(range_matrix).any():
+                        logger.warning("Range数据中包含NaN值")
+
+                    # 在底层(P, 2)数组上直接比较，避免布尔索引生成中间DataFrame
+                    mins, maxs = range_matrix[:, 0], range_matrix[:, 1]
+
+                    # 检查min/max关系合理性
+                    bad_order = mins > maxs
+                    if bad_order.any():
+                        invalid_names = df_range.index[bad_order].tolist()
+                        logger.warning(
+                            "发现%s个参数的min > max: %s",
+                            len(invalid_names),
+                            invalid_names,
+                        )
+
+                    # 检查是否存在负值范围（可能不合理）
+                    negative = (mins < 0) | (maxs < 0)
+                    if negative.any():
+                        negative_names = df_range.index[negative].tolist()
+                        logger.warning(
+                            "发现%s个参数包含负值: %s",
+                            len(negative_names),
+                            negative_names,
                         )
 
-                        # 检查异常值
-                        if df_range.isna().any().any():
-                            logger.warning("Range数据中包含NaN值")
-
-                        # 检查min/max关系合理性
-                        invalid_ranges = df_range[df_range["min"] > df_range["max"]]
-                        if not invalid_ranges.empty:
-                            logger.warning(
-                                f"发现{len(invalid_ranges)}个参数的min > max: {invalid_ranges.index.tolist()}"
-                            )
-
-                        # 检查是否存在负值范围（可能不合理）
-                        negative_ranges = df_range[
-                            (df_range["min"] < 0) | (df_range["max"] < 0)
-                        ]
-                        if not negative_ranges.empty:
-                            logger.warning(
-                                f"发现{len(negative_ranges)}个参数包含负值: {negative_ranges.index.tolist()}"
-                            )
-
-                        csv_data["range_data"] = df_range
-                        logger.info(f"解析Range数据: {df_range.shape}")
+                    csv_data["range_data"] = df_range
+                    logger.info("解析Range数据: %s", df_range.shape)
                 else:
                     logger.error(
-                        f"Range数据长度不匹配: 期望{expected_size}, 实际{len(range_values)}"
+                        "Range数据长度不匹配: 期望%s, 实际%s",
+                        expected_size,
+                        len(range_values),
                     )
 
         except Exception as e:
-            logger.error(f"Range数据解析失败: {str(e)}")
+            logger.error("Range数据解析失败: %s", e)
 
         return csv_data
 
-    def _reshape_to_matrix(self, flat_list: list, rows: int, cols: int) -> list:
-        """将扁平化列表重新组织为矩阵"""
-        if len(flat_list) != rows * cols:
+    def _reshape_to_matrix(
+        self, flat_list: list, rows: int, cols: int
+    ) -> np.ndarray | None:
+        """将扁平化列表重新组织为矩阵（float64 ndarray，失败返回None）"""
+        matrix = np.asarray(flat_list, dtype=np.float64)
+        if matrix.size != rows * cols:
             logger.error(
-                f"数据长度不匹配: 期望{rows}x{cols}={rows * cols}, 实际{len(flat_list)}"
+                "数据长度不匹配: 期望%sx%s=%s, 实际%s",
+                rows,
+                cols,
+                rows * cols,
+                matrix.size,
             )
-            return []
+            return None
+        return matrix.reshape(rows, cols)
 
-        matrix = []
-        for i in range(rows):
-            row = flat_list[i * cols : (i + 1) * cols]
-            matrix.append(row)
-        return matrix
+    @staticmethod
+    def _render_csv(df: pd.DataFrame) -> bytes:
+        """将DataFrame编码为CSV字节流（pandas直接按utf-8写入二进制缓冲区）"""
+        if _is_plain_float_frame(df):
+            return _render_float_csv(df)
+        output = io.BytesIO()
+        df.to_csv(output, index=True, encoding="utf-8")
+        return output.getvalue()
 
     def generate_csv_files(self, csv_data: dict[str, pd.DataFrame]) -> dict[str, bytes]:
         """
@@ -575,12 +806,10 @@ class DecryptionManager:
         csv_files = {}
         total_size = 0
 
+        # 逐个编码：数值矩阵走纯Python快速路径，多线程只会增加调度开销
         for data_type, df in csv_data.items():
             try:
-                # 生成CSV字节流
-                output = io.StringIO()
-                df.to_csv(output, index=True, encoding="utf-8")
-                csv_content = output.getvalue().encode("utf-8")
+                csv_content = self._render_csv(df)
 
                 filename = f"{data_type}.csv"
                 csv_files[filename] = csv_content
@@ -588,34 +817,123 @@ class DecryptionManager:
                 total_size += file_size
 
                 logger.info(
-                    f"✅ {filename}: {file_size:,} bytes, {df.shape[0]}×{df.shape[1]}"
+                    "✅ %s: %s bytes, %s×%s",
+                    filename,
+                    format(file_size, ","),
+                    df.shape[0],
+                    df.shape[1],
                 )
 
             except Exception as e:
-                logger.error(f"❌ 生成{data_type}的CSV文件失败: {str(e)}")
+                logger.error("❌ 生成%s的CSV文件失败: %s", data_type, e)
 
         if csv_files:
             logger.info("🎉 CSV文件生成完成！")
-            logger.info(f"📄 文件总数: {len(csv_files)}个")
-            logger.info(f"📊 总大小: {total_size:,} bytes ({total_size / 1024:.1f} KB)")
+            logger.info("📄 文件总数: %s个", len(csv_files))
+            logger.info(
+                "📊 总大小: %s bytes (%.1f KB)",
+                format(total_size, ","),
+                total_size / 1024,
+            )
 
         return csv_files
 
+    @staticmethod
+    def _render_feather(df: pd.DataFrame) -> bytes:
+        """将DataFrame编码为Feather(Arrow IPC)字节流，行标签写为index列"""
+        output = io.BytesIO()
+        # Feather不支持非默认行索引，行标签作为普通列保存
+        df.reset_index().to_feather(output, compression="uncompressed")
+        return output.getvalue()
+
+    def generate_feather_files(
+        self, csv_data: dict[str, pd.DataFrame]
+    ) -> dict[str, bytes]:
+        """
+        生成Feather文件的字节内容（二进制列式格式，比CSV更小、写出更快）
+
+        读取时使用 ``pd.read_feather(buf).set_index("index")`` 还原行标签。
+
+        Args:
+            csv_data: 包含DataFrame的字典
+
+        Returns:
+            包含Feather文件名和字节内容的字典
+        """
+        feather_files = {}
+        for data_type, df in csv_data.items():
+            filename = f"{data_type}.feather"
+            try:
+                feather_files[filename] = self._render_feather(df)
+            except Exception as e:
+                logger.error("❌ 生成%s的Feather文件失败: %s", data_type, e)
+
+        logger.info("📄 生成Feather文件: %s个", len(feather_files))
+        return feather_files
+
+    def stream_csv_files(
+        self,
+        decrypted_data: dict[str, Any],
+        sink_factory: Callable[[str], BinaryIO],
+        fields: set[str] | None = None,
+    ) -> list[str]:
+        """
+        逐个解析系数并直接写出CSV，不同时持有全部DataFrame和CSV字节
+
+        Args:
+            decrypted_data: 解密后的数据
+            sink_factory: 按文件名返回可写二进制流的工厂函数（如BytesIO或
+                zip条目），流的关闭由调用方负责
+            fields: 只写出这些输出（同 parse_to_csv_format），None表示全部
+
+        Returns:
+            已写出的CSV文件名列表
+        """
+        model_type = decrypted_data.get("type", 0)
+        specs = self._coefficient_schema().get(model_type)
+        if specs is None:
+            logger.error("❌ 不支持的模型类型: %s", model_type)
+            return []
+
+        # 每次只解析一个系数，写出后即释放对应DataFrame
+        parsers = [
+            functools.partial(self._parse_coefficients, decrypted_data, [spec])
+            for spec in specs
+            if fields is None or spec[1] in fields
+        ]
+        if fields is None or "range_data" in fields:
+            parsers.append(functools.partial(self._parse_range_data, decrypted_data))
+
+        written = []
+        for parse in parsers:
+            for data_type, df in parse().items():
+                filename = f"{data_type}.csv"
+                try:
+                    sink_factory(filename).write(self._render_csv(df))
+                    written.append(filename)
+                except Exception as e:
+                    logger.error("❌ 写出%s失败: %s", filename, e)
+
+        logger.info("📄 流式写出CSV文件: %s个", len(written))
+        return written
+
     def _validate_file_path(self, file_path: str) -> dict[str, Any]:
         """验证文件路径和基本属性"""
         try:
             path_obj = Path(file_path)
 
-            # 检查文件是否存在
-            if not path_obj.exists():
+            # 只调用一次stat：不存在由异常判断，类型和大小都取自同一结果
+            try:
+                stat_result = path_obj.stat()
+            except FileNotFoundError:
                 return {"valid": False, "error": f"文件不存在: {file_path}"}
 
             # 检查是否为文件（非目录）
-            if not path_obj.is_file():
+            if not stat.S_ISREG(stat_result.st_mode):
                 return {"valid": False, "error": f"路径不是文件: {file_path}"}
 
             # 检查文件大小（不能为空，不能过大）
-            file_size = path_obj.stat().st_size
+            file_size = stat_result.st_size
             if file_size == 0:
                 return {"valid": False, "error": "文件为空"}
 
@@ -630,22 +948,33 @@ class DecryptionManager:
             # 检查文件扩展名
             allowed_extensions = {".bin", ".json", ".txt"}  # 允许的扩展名
             if path_obj.suffix.lower() not in allowed_extensions:
-                logger.warning(f"文件扩展名不常见: {path_obj.suffix}")
+                logger.warning("文件扩展名不常见: %s", path_obj.suffix)
 
             return {"valid": True, "size": file_size}
 
         except Exception as e:
             return {"valid": False, "error": f"文件路径验证异常: {str(e)}"}
 
-    def _infer_dimensions_from_data(self, data: dict[str, Any]) -> None:
-        """从解密数据反推维度并设置配置"""
-        param_count, feature_count = self._infer_dimensions(data)
+    def _infer_dimensions_from_data(
+        self,
+        data: dict[str, Any],
+        dimensions: tuple[int, int | None] | None = None,
+    ) -> None:
+        """从解密数据反推维度并设置配置
+
+        Args:
+            data: 解密后的数据字典
+            dimensions: 已推断的 (指标数, 特征数)，为None时从数据重新推断
+        """
+        if dimensions is None:
+            dimensions = self._infer_dimensions(data)
+        param_count, feature_count = dimensions
 
         # 当feature_count为None时（Type 0场景），设置feature_stations为None
         if feature_count is None:
             if param_count != len(self._default_water_params):
                 self._detected_config = {
-                    "water_params": [f"param_{i + 1}" for i in range(param_count)],
+                    "water_params": list(_generic_names("param_", param_count)),
                     "feature_stations": None,
                 }
             else:
@@ -653,22 +982,22 @@ class DecryptionManager:
                     "water_params": self._default_water_params,
                     "feature_stations": None,
                 }
-            logger.info(f"📐 维度结果: {param_count}参数, 特征数不适用")
+            logger.info("📐 维度结果: %s参数, 特征数不适用", param_count)
             return
 
         # 生成参数名和站点名
         if param_count != len(self._default_water_params):
             self._detected_config = {
-                "water_params": [f"param_{i + 1}" for i in range(param_count)],
-                "feature_stations": [f"STZ{i + 1}" for i in range(feature_count)],
+                "water_params": list(_generic_names("param_", param_count)),
+                "feature_stations": list(_generic_names("STZ", feature_count)),
             }
-            logger.info(f"📐 反推维度: {param_count}参数 × {feature_count}特征")
+            logger.info("📐 反推维度: %s参数 × %s特征", param_count, feature_count)
         else:
             self._detected_config = {
                 "water_params": self._default_water_params,
-                "feature_stations": [f"STZ{i + 1}" for i in range(feature_count)],
+                "feature_stations": list(_generic_names("STZ", feature_count)),
             }
-            logger.info(f"📐 使用默认参数名，{feature_count}个特征站点")
+            logger.info("📐 使用默认参数名，%s个特征站点", feature_count)
 
     def _infer_dimensions(self, data: dict[str, Any]) -> tuple[int, int | None]:
         """
@@ -686,84 +1015,111 @@ class DecryptionManager:
             (param_count, feature_count) 指标数和特征数
         """
         try:
-            logger.info("=" * 50)
-            logger.info("🔍 [维度推断] 开始自适应推断数据维度...")
+            # INFO被过滤时跳过所有诊断日志的字符串格式化
+            verbose = logger.isEnabledFor(logging.INFO)
 
-            # 分析各系数数组长度
-            coeff_info = {}
-            for key, value in data.items():
+            # 单次扫描：只采集参与推断的系数长度
+            lengths: dict[str, int] = {}
+            for key in _DIMENSION_KEYS:
+                value = data.get(key)
                 if isinstance(value, list):
-                    coeff_info[key] = len(value)
-            logger.info(f"📊 [维度推断] 原始数据长度: {coeff_info}")
+                    lengths[key] = len(value)
+
+            if verbose:
+                logger.info("=" * 50)
+                logger.info("🔍 [维度推断] 开始自适应推断数据维度...")
+                logger.info("📊 [维度推断] 原始数据长度: %s", lengths)
 
             # 步骤1: 从A参数确定指标数
-            if "A" not in data or not isinstance(data["A"], list):
+            param_count = lengths.get("A")
+            if param_count is None:
                 logger.warning("⚠️ [维度推断] 未找到A参数，使用默认指标数11")
                 param_count = 11
-            else:
-                param_count = len(data["A"])
+            elif verbose:
                 logger.info(
-                    f"✅ [维度推断] 从A参数推断指标数: {param_count}个 (A长度={param_count})"
+                    "✅ [维度推断] 从A参数推断指标数: %s个 (A长度=%s)",
+                    param_count,
+                    param_count,
                 )
 
             # 步骤2: 从w或a系数推断特征数
             feature_count = None
-            for coeff_key in ["w", "a"]:
-                if coeff_key in data and isinstance(data[coeff_key], list):
-                    coeff_length = len(data[coeff_key])
+            for coeff_key in ("w", "a"):
+                coeff_length = lengths.get(coeff_key)
+                if coeff_length is None:
+                    continue
+                if verbose:
                     logger.info(
-                        f"📐 [维度推断] 尝试从{coeff_key}推断: 长度={coeff_length}, 指标数={param_count}"
+                        "📐 [维度推断] 尝试从%s推断: 长度=%s, 指标数=%s",
+                        coeff_key,
+                        coeff_length,
+                        param_count,
                     )
-                    if coeff_length % param_count == 0:
-                        feature_count = coeff_length // param_count
+                if coeff_length % param_count == 0:
+                    feature_count = coeff_length // param_count
+                    if verbose:
                         logger.info(
-                            f"✅ [维度推断] 从{coeff_key}系数推断特征数: {feature_count}个"
+                            "✅ [维度推断] 从%s系数推断特征数: %s个",
+                            coeff_key,
+                            feature_count,
                         )
                         logger.info(
-                            f"📐 [维度推断] 计算公式: {coeff_length} ÷ {param_count} = {feature_count}"
-                        )
-                        break
-                    else:
-                        logger.warning(
-                            f"⚠️ [维度推断] {coeff_key}系数长度{coeff_length}不能被指标数{param_count}整除"
+                            "📐 [维度推断] 计算公式: %s ÷ %s = %s",
+                            coeff_length,
+                            param_count,
+                            feature_count,
                         )
+                    break
+                logger.warning(
+                    "⚠️ [维度推断] %s系数长度%s不能被指标数%s整除",
+                    coeff_key,
+                    coeff_length,
+                    param_count,
+                )
 
             # 步骤3: 如果w/a都没有，尝试从b推断
-            if feature_count is None and "b" in data and isinstance(data["b"], list):
-                b_length = len(data["b"])
-                logger.info(
-                    f"📐 [维度推断] 尝试从b推断: 长度={b_length}, 指标数={param_count}"
-                )
+            b_length = lengths.get("b")
+            if feature_count is None and b_length is not None:
+                if verbose:
+                    logger.info(
+                        "📐 [维度推断] 尝试从b推断: 长度=%s, 指标数=%s",
+                        b_length,
+                        param_count,
+                    )
                 if b_length % param_count == 0:
                     feature_count = b_length // param_count
-                    logger.info(f"✅ [维度推断] 从b系数推断特征数: {feature_count}个")
+                    if verbose:
+                        logger.info(
+                            "✅ [维度推断] 从b系数推断特征数: %s个", feature_count
+                        )
 
             # 步骤4: 如果还是无法推断，返回None（Type 0场景无特征维度信息）
-            if feature_count is None:
+            if feature_count is None and verbose:
                 logger.info(
                     "ℹ️ [维度推断] 数据中无特征维度信息（Type 0模型仅含A和Range）"
                 )
 
             # 验证Range数据一致性
-            if "Range" in data and isinstance(data["Range"], list):
-                range_length = len(data["Range"])
-                expected_range = param_count * 2
-                if range_length != expected_range:
-                    logger.warning(
-                        f"⚠️ [维度推断] Range长度{range_length}与期望{expected_range}不一致"
-                    )
+            range_length = lengths.get("Range")
+            if range_length is not None and range_length != param_count * 2:
+                logger.warning(
+                    "⚠️ [维度推断] Range长度%s与期望%s不一致",
+                    range_length,
+                    param_count * 2,
+                )
 
-            feature_label = (
-                f"{feature_count}个特征" if feature_count is not None else "不适用"
-            )
-            logger.info(
-                f"🎯 [维度推断] 最终结果: {param_count}个指标 × {feature_label}"
-            )
-            logger.info("=" * 50)
+            if verbose:
+                feature_label = (
+                    f"{feature_count}个特征" if feature_count is not None else "不适用"
+                )
+                logger.info(
+                    "🎯 [维度推断] 最终结果: %s个指标 × %s", param_count, feature_label
+                )
+                logger.info("=" * 50)
             return param_count, feature_count
 
         except Exception as e:
-            logger.error(f"❌ [维度推断] 推断维度时出错: {str(e)}，使用默认值")
+            logger.error("❌ [维度推断] 推断维度时出错: %s，使用默认值", e)
             return 11, None
 
     def _infer_feature_count(self, data: dict[str, Any]) -> int:
@@ -776,38 +1132,44 @@ class DecryptionManager:
     ):
         """验证特征数量一致性"""
         try:
-            expected_sizes = {
-                "w": feature_count * param_count,
-                "a": feature_count * param_count,
-                "b": param_count * feature_count,
-                "A": param_count,
-                "Range": param_count * 2,
-            }
-
             inconsistencies = []
-            for key, expected_size in expected_sizes.items():
+            verbose = logger.isEnabledFor(logging.DEBUG)
+            for key, expected_size in _expected_sizes(param_count, feature_count):
                 if key in data and isinstance(data[key], list):
                     actual_size = len(data[key])
                     if actual_size == expected_size:
-                        logger.info(f"  ✅ {key}: {actual_size} (符合预期)")
+                        # 逐项通过信息仅在DEBUG下输出，正常情况只保留汇总
+                        if verbose:
+                            logger.debug("  ✅ %s: %s (符合预期)", key, actual_size)
                     else:
                         inconsistencies.append(f"{key}: {actual_size}≠{expected_size}")
                         logger.warning(
-                            f"  ⚠️ {key}: {actual_size} (期望{expected_size})"
+                            "  ⚠️ %s: %s (期望%s)", key, actual_size, expected_size
                         )
 
             if inconsistencies:
                 logger.warning(
-                    f"⚠️ 发现{len(inconsistencies)}个维度不一致: {', '.join(inconsistencies)}"
+                    "⚠️ 发现%s个维度不一致: %s",
+                    len(inconsistencies),
+                    ", ".join(inconsistencies),
                 )
             else:
                 logger.info("✅ 所有系数维度一致性验证通过")
 
         except Exception as e:
-            logger.error(f"❌ 特征一致性验证出错: {str(e)}")
+            logger.error("❌ 特征一致性验证出错: %s", e)
 
-    def _validate_decrypted_data(self, data: dict[str, Any]) -> dict[str, Any]:
-        """验证解密后的数据结构"""
+    def _validate_decrypted_data(
+        self,
+        data: dict[str, Any],
+        dimensions: tuple[int, int | None] | None = None,
+    ) -> dict[str, Any]:
+        """验证解密后的数据结构
+
+        Args:
+            data: 解密后的数据字典
+            dimensions: 已推断的 (指标数, 特征数)，为None时从数据重新推断
+        """
         try:
             # 检查基本结构
             if not isinstance(data, dict):
@@ -828,24 +1190,26 @@ class DecryptionManager:
             if model_type not in [0, 1]:
                 return {"valid": False, "error": f"不支持的模型类型: {model_type}"}
 
-            # 自适应推断指标数和特征数
-            param_count, feature_count = self._infer_dimensions(data)
+            # 自适应推断指标数和特征数（调用方已推断时直接复用）
+            if dimensions is None:
+                dimensions = self._infer_dimensions(data)
+            param_count, feature_count = dimensions
 
             # 动态生成水质参数名（如果从数据推断的数量与默认不同）
             if param_count != len(self._default_water_params):
                 # 生成通用参数名 param_1, param_2, ...
-                self._default_water_params = [
-                    f"param_{i}" for i in range(1, param_count + 1)
-                ]
+                self._default_water_params = list(_generic_names("param_", param_count))
                 logger.info(
-                    f"动态生成水质参数名: {param_count}个 (param_1-param_{param_count})"
+                    "动态生成水质参数名: %s个 (param_1-param_%s)",
+                    param_count,
+                    param_count,
                 )
 
             # 动态设置特征站点
             if feature_count is not None:
-                self.feature_stations = [f"STZ{i}" for i in range(1, feature_count + 1)]
+                self.feature_stations = list(_generic_names("STZ", feature_count))
                 logger.info(
-                    f"动态设置特征站点: {feature_count}个 (STZ1-STZ{feature_count})"
+                    "动态设置特征站点: %s个 (STZ1-STZ%s)", feature_count, feature_count
                 )
             else:
                 self.feature_stations = None
@@ -866,8 +1230,7 @@ class DecryptionManager:
         self, data: dict[str, Any], param_count: int
     ) -> dict[str, Any]:
         """自适应验证Type 0数据结构"""
-        required_fields = ["A", "Range"]
-        missing_fields = [f for f in required_fields if f not in data]
+        missing_fields = _missing_fields(data, 0)
 
         if missing_fields:
             return {
@@ -877,7 +1240,7 @@ class DecryptionManager:
 
         # 验证A系数（长度应等于param_count）
         a_values = data["A"]
-        if not isinstance(a_values, list):
+        if type(a_values) is not list:
             return {
                 "valid": False,
                 "error": f"A系数必须是列表格式，当前类型: {type(a_values)}",
@@ -890,13 +1253,16 @@ class DecryptionManager:
             }
 
         # 验证A系数值类型
-        for i, val in enumerate(a_values):
-            if not isinstance(val, int | float):
-                return {"valid": False, "error": f"A系数[{i}]不是数字类型: {type(val)}"}
+        i = _first_non_numeric(a_values)
+        if i is not None:
+            return {
+                "valid": False,
+                "error": f"A系数[{i}]不是数字类型: {type(a_values[i])}",
+            }
 
         # 验证Range数据（长度应等于param_count * 2）
         range_values = data["Range"]
-        if not isinstance(range_values, list):
+        if type(range_values) is not list:
             return {
                 "valid": False,
                 "error": f"Range数据必须是列表格式，当前类型: {type(range_values)}",
@@ -910,22 +1276,21 @@ class DecryptionManager:
             }
 
         # 验证Range值类型
-        for i, val in enumerate(range_values):
-            if not isinstance(val, int | float):
-                return {
-                    "valid": False,
-                    "error": f"Range数据[{i}]不是数字类型: {type(val)}",
-                }
+        i = _first_non_numeric(range_values)
+        if i is not None:
+            return {
+                "valid": False,
+                "error": f"Range数据[{i}]不是数字类型: {type(range_values[i])}",
+            }
 
-        logger.info(f"✅ Type 0数据验证通过: {param_count}个指标")
+        logger.info("✅ Type 0数据验证通过: %s个指标", param_count)
         return {"valid": True}
 
     def _validate_type_1_data_adaptive(
         self, data: dict[str, Any], param_count: int, feature_count: int
     ) -> dict[str, Any]:
         """自适应验证Type 1数据结构"""
-        required_fields = ["w", "a", "b", "A", "Range"]
-        missing_fields = [f for f in required_fields if f not in data]
+        missing_fields = _missing_fields(data, 1)
 
         if missing_fields:
             return {
@@ -933,19 +1298,11 @@ class DecryptionManager:
                 "error": f"Type 1模式缺少必需字段: {missing_fields}",
             }
 
-        # 使用自适应维度计算期望长度
-        expected_sizes = {
-            "w": feature_count * param_count,
-            "a": feature_count * param_count,
-            "b": param_count * feature_count,
-            "A": param_count,
-            "Range": param_count * 2,
-        }
-
-        for field, expected_size in expected_sizes.items():
+        # 使用自适应维度计算期望长度（同一形状只计算一次）
+        for field, expected_size in _expected_sizes(param_count, feature_count):
             field_data = data[field]
 
-            if not isinstance(field_data, list):
+            if type(field_data) is not list:
                 return {
                     "valid": False,
                     "error": f"{field}系数必须是列表格式，当前类型: {type(field_data)}",
@@ -958,147 +1315,14 @@ class DecryptionManager:
                 }
 
             # 验证数值类型
-            for i, val in enumerate(field_data):
-                if not isinstance(val, int | float):
-                    return {
-                        "valid": False,
-                        "error": f"{field}系数[{i}]不是数字类型: {type(val)}",
-                    }
-
-        logger.info(
-            f"✅ Type 1数据验证通过: {param_count}个指标 × {feature_count}个特征"
-        )
-        return {"valid": True}
-
-    def _validate_type_0_data(self, data: dict[str, Any]) -> dict[str, Any]:
-        """验证Type 0数据结构（向后兼容）"""
-        required_fields = ["A", "Range"]
-        missing_fields = []
-
-        for field in required_fields:
-            if field not in data:
-                missing_fields.append(field)
-
-        if missing_fields:
-            return {
-                "valid": False,
-                "error": f"Type 0模式缺少必需字段: {missing_fields}",
-            }
-
-        # 验证A系数
-        a_values = data["A"]
-        if not isinstance(a_values, list):
-            return {
-                "valid": False,
-                "error": f"A系数必须是列表格式，当前类型: {type(a_values)}",
-            }
-
-        if len(a_values) != len(self.water_params):
-            return {
-                "valid": False,
-                "error": f"A系数长度不匹配: 期望{len(self.water_params)}, 实际{len(a_values)}",
-            }
-
-        # 验证A系数值类型和范围
-        for i, val in enumerate(a_values):
-            if not isinstance(val, int | float):
-                return {"valid": False, "error": f"A系数[{i}]不是数字类型: {type(val)}"}
-            if abs(val) > 1000:  # 合理性检查
-                logger.warning(f"A系数[{i}]值较大: {val}")
-
-        # 验证Range数据
-        range_values = data["Range"]
-        if not isinstance(range_values, list):
-            return {
-                "valid": False,
-                "error": f"Range数据必须是列表格式，当前类型: {type(range_values)}",
-            }
-
-        expected_range_length = len(self.water_params) * 2
-        if len(range_values) != expected_range_length:
-            return {
-                "valid": False,
-                "error": f"Range数据长度不匹配: 期望{expected_range_length}, 实际{len(range_values)}",
-            }
-
-        # 验证Range值
-        for i, val in enumerate(range_values):
-            if not isinstance(val, int | float):
-                return {
-                    "valid": False,
-                    "error": f"Range数据[{i}]不是数字类型: {type(val)}",
-                }
-
-        # 验证min/max配对
-        for i in range(0, len(range_values), 2):
-            if i + 1 < len(range_values):
-                min_val, max_val = range_values[i], range_values[i + 1]
-                if min_val > max_val:
-                    logger.warning(
-                        f"Range数据第{i // 2 + 1}组: min({min_val}) > max({max_val})"
-                    )
-
-        return {"valid": True}
-
-    def _validate_type_1_data(self, data: dict[str, Any]) -> dict[str, Any]:
-        """验证Type 1数据结构"""
-        required_fields = ["w", "a", "b", "A", "Range"]
-        missing_fields = []
-
-        for field in required_fields:
-            if field not in data:
-                missing_fields.append(field)
-
-        if missing_fields:
-            return {
-                "valid": False,
-                "error": f"Type 1模式缺少必需字段: {missing_fields}",
-            }
-
-        # 验证各系数数组的长度
-        expected_sizes = {
-            "w": len(self.feature_stations) * len(self.water_params),  # 26*11
-            "a": len(self.feature_stations) * len(self.water_params),  # 26*11
-            "b": len(self.water_params) * len(self.feature_stations),  # 11*26
-            "A": len(self.water_params),  # 11
-            "Range": len(self.water_params) * 2,  # 11*2
-        }
-
-        for field, expected_size in expected_sizes.items():
-            field_data = data[field]
-
-            if not isinstance(field_data, list):
-                return {
-                    "valid": False,
-                    "error": f"{field}系数必须是列表格式，当前类型: {type(field_data)}",
-                }
-
-            if len(field_data) != expected_size:
+            i = _first_non_numeric(field_data)
+            if i is not None:
                 return {
                     "valid": False,
-                    "error": f"{field}系数长度不匹配: 期望{expected_size}, 实际{len(field_data)}",
+                    "error": f"{field}系数[{i}]不是数字类型: {type(field_data[i])}",
                 }
 
-            # 验证数值类型
-            for i, val in enumerate(field_data):
-                if not isinstance(val, int | float):
-                    return {
-                        "valid": False,
-                        "error": f"{field}系数[{i}]不是数字类型: {type(val)}",
-                    }
-
-                # 合理性检查
-                if field != "Range" and abs(val) > 1000:
-                    logger.warning(f"{field}系数[{i}]值较大: {val}")
-
-        # 验证Range数据的min/max配对
-        range_values = data["Range"]
-        for i in range(0, len(range_values), 2):
-            if i + 1 < len(range_values):
-                min_val, max_val = range_values[i], range_values[i + 1]
-                if min_val > max_val:
-                    logger.warning(
-                        f"Range数据第{i // 2 + 1}组: min({min_val}) > max({max_val})"
-                    )
-
+        logger.info(
+            "✅ Type 1数据验证通过: %s个指标 × %s个特征", param_count, feature_count
+        )
         return {"valid": True}
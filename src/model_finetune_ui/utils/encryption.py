@@ -6,6 +6,7 @@
 仅使用旧格式（兼容C++）：[IV 16字节][加密数据]
 """
 
+import functools
 import json
 import logging
 import os
@@ -13,16 +14,38 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from cryptography.hazmat.primitives import hashes, padding
+from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 # 导入本地工具
 from .utils import ConfigManager, EnhancedLogger, performance_monitor
 
+try:
+    from fastpbkdf2 import pbkdf2_hmac
+except ImportError:  # fastpbkdf2为可选加速依赖，不可用时使用OpenSSL实现的hashlib
+    from hashlib import pbkdf2_hmac
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _derive_key(
+    password: bytes, salt: bytes, iterations: int, key_length: int
+) -> bytes:
+    """PBKDF2-HMAC-SHA256派生密钥（按参数缓存）
+
+    加密端与解密管理器共用此函数；兼容函数每次调用都会新建管理器，
+    缓存放在模块级才能跨实例复用。结果与cryptography的PBKDF2HMAC一致。
+    """
+    return pbkdf2_hmac("sha256", password, salt, iterations, key_length)
+
+
+@functools.lru_cache(maxsize=8)
+def _aes_algorithm(key: bytes) -> algorithms.AES:
+    """按密钥缓存AES算法对象（只保存密钥，可在多个Cipher间复用）"""
+    return algorithms.AES(key)
+
+
 class EncryptionManager:
     """加密管理器"""
 
@@ -317,6 +340,11 @@ class LowLevelEncryptionManager:
             :16
         ]  # 确保IV是16字节
 
+    @property
+    def _derived_key(self) -> bytes:
+        """当前password/salt对应的密钥（兼容函数修改参数后自动重新派生）"""
+        return _derive_key(self.password, self.salt, self.iterations, self.key_length)
+
     def encrypt_data(self, data_obj: Any, output_dir: str | None = None) -> str | None:
         """
         加密数据并保存到文件
@@ -329,31 +357,30 @@ class LowLevelEncryptionManager:
             str: 输出文件的路径，失败返回None
         """
         try:
-            # 生成加密密钥
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=self.key_length,
-                salt=self.salt,
-                iterations=self.iterations,
-            )
-            key = kdf.derive(self.password)
-
-            # 准备加密器
-            cipher = Cipher(algorithms.AES(key), modes.CBC(self.iv))
+            # 准备加密器（密钥和AES算法对象均按参数缓存）
+            cipher = Cipher(_aes_algorithm(self._derived_key), modes.CBC(self.iv))
             encryptor = cipher.encryptor()
 
             # 将结果转换为JSON
             data_json = json.dumps(data_obj, ensure_ascii=False)
 
-            # 对数据进行填充
-            padder = padding.PKCS7(128).padder()
-            padded_data = padder.update(data_json.encode("utf-8")) + padder.finalize()
+            raw_data = data_json.encode("utf-8")
 
-            # 加密数据
-            encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+            # PKCS7填充长度（1-16字节），密文长度与填充后的明文相同
+            pad_len = 16 - len(raw_data) % 16
+            total_len = len(self.iv) + len(raw_data) + pad_len
 
             # 加密数据格式: [IV 16字节][加密数据] - 兼容C++
-            final_data = self.iv + encrypted_data
+            # 预分配输出缓冲区，update_into直接把密文写在IV之后，不生成填充明文
+            # 和密文的中间副本；update_into要求输出区多留block_size-1字节余量
+            final_data = bytearray(total_len + 15)
+            final_data[: len(self.iv)] = self.iv
+            with memoryview(final_data) as view:
+                written = len(self.iv)
+                written += encryptor.update_into(raw_data, view[written:])
+                encryptor.update_into(bytes([pad_len]) * pad_len, view[written:])
+            encryptor.finalize()
+            del final_data[total_len:]
             self.logger.info("加密完成（兼容C++格式）")
 
             # 如果未提供输出路径，则生成带时间戳的文件名
@@ -406,17 +433,8 @@ class LowLevelEncryptionManager:
             iv = file_data[:16]
             encrypted_data = file_data[16:]
 
-            # 从密码和盐值生成密钥
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=self.key_length,
-                salt=self.salt,
-                iterations=self.iterations,
-            )
-            key = kdf.derive(self.password)
-
-            # 解密
-            cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
+            # 解密（密钥和AES算法对象均按参数缓存，IV取自文件）
+            cipher = Cipher(_aes_algorithm(self._derived_key), modes.CBC(iv))
             decryptor = cipher.decryptor()
 
             # 解密数据
@@ -16,6 +16,9 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# 文件名非法字符替换表（str.translate查表，避免逐次调用正则引擎）
+_FILENAME_TRANS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
 
 class PerformanceMonitor:
     """性能监控装饰器和工具"""
@@ -120,12 +123,18 @@ class EnhancedLogger:
     @staticmethod
     def log_operation_context(operation: str, **context):
         """记录操作上下文信息"""
+        # INFO被过滤时不拼接上下文字符串
+        if not logger.isEnabledFor(logging.INFO):
+            return
         context_str = ", ".join([f"{k}={v}" for k, v in context.items()])
         logger.info(f"[操作上下文] {operation}: {context_str}")
 
     @staticmethod
     def log_file_info(file_path: str | Path, operation: str = "处理"):
         """记录文件信息"""
+        # 仅用于日志，INFO和WARNING都被过滤时无需访问文件系统
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         try:
             path = Path(file_path)
             if path.exists():
@@ -409,12 +418,7 @@ class FileUtils:
     @staticmethod
     def clean_filename(filename: str) -> str:
         """清理文件名中的非法字符"""
-        import re
-
-        # 移除或替换非法字符
-        illegal_chars = r'[<>:"/\\|?*]'
-        cleaned = re.sub(illegal_chars, '_', filename)
-        return cleaned.strip()
+        return filename.translate(_FILENAME_TRANS).strip()
 
 
 class ConfigManager:
@@ -9,7 +9,12 @@ import numpy as np
 import pandas as pd
 
 from src.model_finetune_ui.utils.decryption import DecryptionManager
-from src.model_finetune_ui.utils.encryption import EncryptionManager
+from src.model_finetune_ui.utils.encryption import (
+    EncryptionManager,
+    LowLevelEncryptionManager,
+    decrypt_file,
+    encrypt_data_to_file,
+)
 
 
 class TestDecryptWorkflow:
@@ -42,6 +47,15 @@ class TestDecryptWorkflow:
         result = decryptor.decrypt_bin_file(str(corrupted_file))
         assert result is None
 
+    def test_low_level_encrypt_decrypt_roundtrip(self, temp_dir):
+        """测试底层AES加密结果可解密还原，且自定义密码生效"""
+        data = {"type": 0, "A": [1.0] * 11, "Range": [0.0, 10.0] * 11}
+
+        path = encrypt_data_to_file(data, output_dir=str(temp_dir))
+
+        assert LowLevelEncryptionManager().decrypt_file(path) == data
+        assert decrypt_file(path, password=b"wrong_password") is None
+
     def test_parse_to_csv_format_type_0(self):
         """测试Type 0数据解析为CSV格式"""
         decryptor = DecryptionManager()
@@ -2,8 +2,10 @@
 DecryptionManager单元测试
 """
 
+import io
 import json
 
+import numpy as np
 import pandas as pd
 
 from src.model_finetune_ui.utils.decryption import DecryptionManager
@@ -30,6 +32,42 @@ class TestDecryptionManager:
         assert "salt" in config
         assert "iv" in config
 
+    def test_invalidate_config(self, monkeypatch):
+        """测试解密配置缓存及失效"""
+        monkeypatch.setattr(
+            "src.model_finetune_ui.utils.decryption.ConfigManager.get_encryption_config",
+            lambda: {"password": "secret", "salt": "salt", "iv": "iv"},
+        )
+        decryptor = DecryptionManager()
+        config = decryptor.get_decryption_config()
+        decryptor._decrypt_cache = (("model.bin", 1, 1), {"type": 0})
+
+        assert decryptor.get_decryption_config() is config
+
+        decryptor.invalidate_config()
+
+        assert decryptor.get_decryption_config() is not config
+        assert decryptor._decrypt_cache is None
+
+    def test_decryption_config_failure_not_cached(self, monkeypatch):
+        """测试读取配置失败时返回默认值但不缓存，配置补齐后可恢复"""
+        config_manager = "src.model_finetune_ui.utils.decryption.ConfigManager"
+
+        def missing_config():
+            raise ValueError("缺失加密信息")
+
+        monkeypatch.setattr(f"{config_manager}.get_encryption_config", missing_config)
+        decryptor = DecryptionManager()
+
+        assert decryptor.get_decryption_config()["password"] == "default_password"
+
+        configured = {"password": "secret", "salt": "salt", "iv": "iv"}
+        monkeypatch.setattr(
+            f"{config_manager}.get_encryption_config", lambda: configured
+        )
+
+        assert decryptor.get_decryption_config() is configured
+
     def test_simple_decrypt_valid_json(self, temp_dir):
         """测试简化解密功能（有效JSON文件）"""
         decryptor = DecryptionManager()
@@ -77,6 +115,16 @@ class TestDecryptionManager:
         assert "A" in result
         assert "Range" in result
 
+    def test_simple_decrypt_invalid_input(self, temp_dir):
+        """测试简化解密对无效JSON和不存在文件返回None"""
+        decryptor = DecryptionManager()
+
+        bad_file = temp_dir / "bad.bin"
+        bad_file.write_bytes(b"\x00\xffnot json")
+
+        assert decryptor._simple_decrypt(str(bad_file)) is None
+        assert decryptor._simple_decrypt(str(temp_dir / "missing.bin")) is None
+
     def test_parse_type_0_data(self):
         """测试Type 0数据解析"""
         decryptor = DecryptionManager()
@@ -161,6 +209,84 @@ class TestDecryptionManager:
         assert csv_data["A_coefficients"].shape == (11, 1)  # 参数x1
         assert csv_data["range_data"].shape == (11, 2)  # 参数x2
 
+        # 各DataFrame底层为C连续的float64数组，to_csv可走数值快速路径
+        for df in csv_data.values():
+            values = df.to_numpy()
+            assert values.dtype == np.float64
+            assert values.flags.c_contiguous
+
+    def test_parse_to_csv_format_fields_filter(self):
+        """测试只解析指定输出"""
+        decryptor = DecryptionManager()
+        size = len(decryptor.feature_stations) * len(decryptor.water_params)
+        test_data = {
+            "type": 1,
+            "w": [1.0] * size,
+            "a": [0.5] * size,
+            "b": [-0.2] * size,
+            "A": [-1.0] * 11,
+            "Range": [0.0, 10.0] * 11,
+        }
+
+        csv_data = decryptor.parse_to_csv_format(
+            test_data, fields={"range_data", "b_coefficients"}
+        )
+
+        assert list(csv_data) == ["b_coefficients", "range_data"]
+
+        written = decryptor.stream_csv_files(
+            test_data, lambda name: io.BytesIO(), {"A_coefficients"}
+        )
+
+        assert written == ["A_coefficients.csv"]
+
+    def test_parse_reflects_payload_edits(self, temp_dir):
+        """测试解析结果互不共享内存，并反映调用方对解密数据的修改"""
+        size = 26 * 11
+        data = {
+            "type": 1,
+            "w": [1.0] * size,
+            "a": [0.5] * size,
+            "b": [-0.2] * size,
+            "A": [1.0] * 11,
+            "Range": [0.0, 10.0] * 11,
+        }
+        bin_path = temp_dir / "type1.bin"
+        bin_path.write_text(json.dumps(data).encode("utf-8").hex()[::-1])
+        decryptor = DecryptionManager()
+        decrypted = decryptor.decrypt_bin_file(bin_path)
+
+        decrypted["A"][0] = 42.0
+        assert (
+            decryptor.parse_to_csv_format(decrypted)["A_coefficients"].iloc[0, 0]
+            == 42.0
+        )
+
+        decryptor.parse_to_csv_format(decrypted, fields={"range_data"})
+        decrypted["A"][0] = 43.0
+        first = decryptor.parse_to_csv_format(decrypted)
+
+        assert first["A_coefficients"].iloc[0, 0] == 43.0
+
+        first["w_coefficients"].iloc[0, 0] = -777.0
+        decrypted["A"][0] = 42.0
+        second = decryptor.parse_to_csv_format(decrypted)
+
+        assert second["w_coefficients"].iloc[0, 0] == 1.0
+        assert second["A_coefficients"].iloc[0, 0] == 42.0
+
+    def test_parsed_indexes_not_shared(self):
+        """测试修改某次结果的索引名不影响后续解析"""
+        data = {"type": 0, "A": [1.0] * 11, "Range": [0.0, 10.0] * 11}
+
+        first = DecryptionManager().parse_to_csv_format(data)
+        first["A_coefficients"].index.name = "param"
+        first["range_data"].columns.name = "bound"
+        second = DecryptionManager().parse_to_csv_format(data)
+
+        assert second["range_data"].index.name is None
+        assert second["range_data"].columns.name is None
+
     def test_reshape_to_matrix(self):
         """测试矩阵重塑功能"""
         decryptor = DecryptionManager()
@@ -170,12 +296,14 @@ class TestDecryptionManager:
         matrix = decryptor._reshape_to_matrix(flat_list, 3, 4)
 
         expected = [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]]
-        assert matrix == expected
+        assert matrix.shape == (3, 4)
+        assert matrix.dtype == np.float64
+        assert matrix.tolist() == expected
 
         # 测试错误的数据长度
         wrong_list = list(range(10))  # 长度不匹配
         matrix = decryptor._reshape_to_matrix(wrong_list, 3, 4)
-        assert matrix == []  # 应该返回空列表
+        assert matrix is None  # 应该返回None
 
     def test_generate_csv_files(self):
         """测试CSV文件生成"""
@@ -207,6 +335,61 @@ class TestDecryptionManager:
             lines = csv_str.strip().split('\n')
             assert len(lines) > 1  # 至少有头部和数据行
 
+    def test_render_csv_fast_path_matches_pandas(self):
+        """测试float64快速CSV编码与pandas to_csv逐字节一致"""
+        values = np.array(
+            [[1.0, np.nan], [-0.0, 1e16], [0.1 + 0.2, np.inf], [2.5e-8, -3.0]]
+        )
+        index = ["turbidity", "浊度", "STZ1", "param_4"]
+
+        for labels in (index, ["a,b", "c", "d", "e"]):
+            df = pd.DataFrame(values, index=labels, columns=["min", "max"])
+            expected = io.BytesIO()
+            df.to_csv(expected, index=True, encoding="utf-8")
+
+            assert DecryptionManager._render_csv(df) == expected.getvalue()
+
+    def test_generate_feather_files_roundtrip(self):
+        """测试Feather文件可还原为原始DataFrame"""
+        decryptor = DecryptionManager()
+
+        range_df = pd.DataFrame(
+            {"min": [0.0] * 11, "max": [10.0] * 11}, index=decryptor.water_params
+        )
+        feather_files = decryptor.generate_feather_files({"range_data": range_df})
+
+        assert list(feather_files) == ["range_data.feather"]
+        restored = pd.read_feather(io.BytesIO(feather_files["range_data.feather"]))
+        restored = restored.set_index("index").rename_axis(None)
+        pd.testing.assert_frame_equal(restored, range_df)
+
+    def test_stream_csv_files_matches_generate(self):
+        """测试流式写出与先解析再生成的CSV内容一致"""
+        decryptor = DecryptionManager()
+
+        test_data = {
+            "type": 1,
+            "w": [float(i) for i in range(26 * 11)],
+            "a": [0.5] * (26 * 11),
+            "b": [-0.2] * (11 * 26),
+            "A": [-1.0] * 11,
+            "Range": [0.0, 10.0] * 11,
+        }
+
+        sinks = {}
+
+        def sink_factory(filename):
+            sinks[filename] = io.BytesIO()
+            return sinks[filename]
+
+        written = decryptor.stream_csv_files(test_data, sink_factory)
+        expected = decryptor.generate_csv_files(
+            decryptor.parse_to_csv_format(test_data)
+        )
+
+        assert written == list(expected)
+        assert {name: sink.getvalue() for name, sink in sinks.items()} == expected
+
     def test_parse_to_csv_format_invalid_type(self):
         """测试不支持的模型类型"""
         decryptor = DecryptionManager()
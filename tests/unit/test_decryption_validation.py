@@ -86,7 +86,7 @@ class TestDecryptionValidation:
         decryptor = DecryptionManager()
 
         incomplete_data = {"type": 0, "A": [1.0] * 11}  # 缺少Range
-        result = decryptor._validate_type_0_data(incomplete_data)
+        result = decryptor._validate_type_0_data_adaptive(incomplete_data, 11)
 
         assert result["valid"] is False
         assert "Type 0模式缺少必需字段" in result["error"]
@@ -100,7 +100,7 @@ class TestDecryptionValidation:
             "A": [1.0] * 5,  # 长度不正确
             "Range": [1.0, 2.0] * 11,
         }
-        result = decryptor._validate_type_0_data(invalid_data)
+        result = decryptor._validate_type_0_data_adaptive(invalid_data, 11)
 
         assert result["valid"] is False
         assert "A系数长度不匹配" in result["error"]
@@ -114,7 +114,7 @@ class TestDecryptionValidation:
             "A": [1.0] * 11,
             "Range": [1.0, 2.0] * 5,  # 长度不正确
         }
-        result = decryptor._validate_type_0_data(invalid_data)
+        result = decryptor._validate_type_0_data_adaptive(invalid_data, 11)
 
         assert result["valid"] is False
         assert "Range数据长度不匹配" in result["error"]
@@ -129,7 +129,7 @@ class TestDecryptionValidation:
             "a": [1.0] * (26 * 11),
             # 缺少 b, A, Range
         }
-        result = decryptor._validate_type_1_data(incomplete_data)
+        result = decryptor._validate_type_1_data_adaptive(incomplete_data, 11, 26)
 
         assert result["valid"] is False
         assert "Type 1模式缺少必需字段" in result["error"]
@@ -146,7 +146,7 @@ class TestDecryptionValidation:
             "A": [1.0] * 11,
             "Range": [1.0, 2.0] * 11,
         }
-        result = decryptor._validate_type_1_data(invalid_data)
+        result = decryptor._validate_type_1_data_adaptive(invalid_data, 11, 26)
 
         assert result["valid"] is False
         assert "w系数长度不匹配" in result["error"]
@@ -163,11 +163,32 @@ class TestDecryptionValidation:
             "A": [1.0] * 11,
             "Range": [1.0, 2.0] * 11,
         }
-        result = decryptor._validate_type_1_data(invalid_data)
+        result = decryptor._validate_type_1_data_adaptive(invalid_data, 11, 26)
 
         assert result["valid"] is False
         assert "w系数" in result["error"] and "不是数字类型" in result["error"]
 
+    def test_adaptive_validation_reports_first_non_numeric_index(self):
+        """测试自适应验证定位第一个非数字元素"""
+        decryptor = DecryptionManager()
+
+        invalid_data = {
+            "type": 0,
+            "A": [1.0, 2, None, "x"],
+            "Range": [1.0, 2.0] * 4,
+        }
+        result = decryptor._validate_type_0_data_adaptive(invalid_data, 4)
+
+        assert result["valid"] is False
+        assert "A系数[2]不是数字类型" in result["error"]
+
+        invalid_data["A"] = [1.0, 2, True, 4.5]
+        invalid_data["Range"] = [1.0, 2.0, 3.0, [4.0], 5.0, 6.0, 7.0, 8.0]
+        result = decryptor._validate_type_0_data_adaptive(invalid_data, 4)
+
+        assert result["valid"] is False
+        assert "Range数据[3]不是数字类型" in result["error"]
+
     def test_validation_success_type_0(self):
         """测试Type 0完整验证成功"""
         decryptor = DecryptionManager()
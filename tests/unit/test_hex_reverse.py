@@ -88,6 +88,28 @@ class TestHexReverseDecryption:
         # Assert
         assert detected_format == "aes"
 
+    def test_detect_mixed_case_hex_format(self):
+        """Test detection accepts upper- and lower-case hex digits"""
+        # Arrange
+        hex_data = b"7D0A3A2265707974227B" + b"abcdefABCDEF0123" * 4
+
+        # Act
+        detected_format = DecryptionManager._detect_bin_format(hex_data)
+
+        # Assert
+        assert detected_format == "hex_reverse"
+
+    def test_detect_non_hex_text_format(self):
+        """Test that printable non-hex text is not treated as hex-reverse"""
+        # Arrange
+        json_data = b'{"type": 0, "A": [1.0]}'
+
+        # Act
+        detected_format = DecryptionManager._detect_bin_format(json_data)
+
+        # Assert
+        assert detected_format == "aes"
+
     def test_decrypt_hex_reverse_file(self, temp_dir):
         """Test decryption of hex-reverse BIN file"""
         # Arrange
@@ -117,3 +139,50 @@ class TestHexReverseDecryption:
         assert result["type"] == original_data["type"]
         assert result["A"] == original_data["A"]
         assert result["Range"] == original_data["Range"]
+
+    def test_decrypt_hex_reverse_file_cached_until_content_changes(self, temp_dir):
+        """Test repeat decryption reuses the cached payload until the content changes"""
+        # Arrange
+        data = {"type": 0, "A": [1.0] * 11, "Range": [0.0, 10.0] * 11}
+        bin_path = temp_dir / "test_cached.bin"
+        bin_path.write_text(json.dumps(data).encode("utf-8").hex()[::-1])
+        original_stat = os.stat(bin_path)
+        decryptor = DecryptionManager()
+
+        # Act
+        first = decryptor.decrypt_bin_file(bin_path)
+        first["A"][0] = 99.0
+        decryptor._decrypt_hex_reverse = None  # 命中缓存时不应再解密
+        second = decryptor.decrypt_bin_file(bin_path)
+
+        # Assert
+        assert second["A"] == data["A"]
+
+        # Arrange: 同样大小、同样修改时间但内容不同的文件不能命中缓存
+        del decryptor._decrypt_hex_reverse
+        data["A"] = [2.0] * 11
+        bin_path.write_text(json.dumps(data).encode("utf-8").hex()[::-1])
+        os.utime(bin_path, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+        assert os.stat(bin_path).st_size == original_stat.st_size
+
+        # Act
+        third = decryptor.decrypt_bin_file(bin_path)
+
+        # Assert
+        assert third["A"] == [2.0] * 11
+
+    def test_decrypt_hex_reverse_ignores_whitespace(self, monkeypatch):
+        """Test embedded whitespace is ignored like bytes.fromhex, across chunks"""
+        # Arrange
+        data = {"type": 0, "A": [1.0] * 11, "Range": [0.0, 10.0] * 11}
+        reversed_hex = json.dumps(data).encode("utf-8").hex()[::-1]
+        file_data = (reversed_hex[:40] + "\n" + reversed_hex[40:] + "\r\n").encode()
+        decryptor = DecryptionManager()
+
+        # Act: 用奇数分块大小覆盖跨块的半个字节
+        monkeypatch.setattr("src.model_finetune_ui.utils.decryption._HEX_CHUNK_SIZE", 7)
+        result = decryptor._decrypt_hex_reverse(file_data)
+
+        # Assert
+        assert result == data
+        assert bytes.fromhex(file_data.decode()[::-1]) == json.dumps(data).encode()